@@ -1,13 +1,76 @@
+import asyncio
+import concurrent.futures
+import diskcache
+import httpx
 import requests
+from collections import defaultdict
 import math
 import os
+import threading
 import time
+import numpy as np
+import orjson
 import yfinance as yf
 import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+import _analysis_kernels as _kernels
+
+# Shared HTTP session: reusing pooled connections avoids a fresh TCP+TLS
+# handshake per API call, and transient CoinGecko errors get retried with
+# backoff instead of surfacing immediately.
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504]),
+)
+_session.mount('https://', _adapter)
+
+# Mirror the sync session's Retry policy on the async path: a burst of
+# parallel pages can trip CoinGecko's rate limiter, and those 429s should
+# be backed off and retried, not surfaced as failures.
+_RETRY_STATUSES = (429, 502, 503, 504)
+
+async def _fetch_json(client, url, retries=3):
+    response = await client.get(url)
+    for attempt in range(retries):
+        if response.status_code not in _RETRY_STATUSES:
+            break
+        await asyncio.sleep(0.3 * (2 ** attempt))
+        response = await client.get(url)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+async def _fetch_all(urls):
+    transport = httpx.AsyncHTTPTransport(http2=True, retries=3)
+    async with httpx.AsyncClient(timeout=10, transport=transport) as client:
+        return await asyncio.gather(*[_fetch_json(client, url) for url in urls])
+
+def fetch_all(urls):
+    """Fetches several URLs concurrently and returns their parsed JSON bodies.
+
+    Backed by a single httpx.AsyncClient, so requests to the same host are
+    multiplexed over one HTTP/2 connection instead of one OS thread each.
+    Raises httpx.HTTPError if any request fails.
+    """
+    return asyncio.run(_fetch_all(urls))
+
+# On-disk cache for historical bars. st.cache_data is per-process and
+# gone on restart, while daily series are the largest payloads we fetch
+# and barely change intra-day, so they also get persisted here. Keys
+# embed the UTC date, which invalidates entries at midnight.
+_disk_cache = diskcache.Cache('.cache/hist')
+
+def _utc_date():
+    return time.strftime('%Y%m%d', time.gmtime())
 
 # --- Constants ---
-# Using a static list of S&P 500 tickers is more reliable than scraping
-SP500_TICKERS = [
+# Using a static list of S&P 500 tickers is more reliable than scraping.
+# A tuple keeps it immutable and hashable, so it can be passed straight
+# into @st.cache_data-wrapped functions as part of the cache key.
+SP500_TICKERS = (
     'AAPL', 'MSFT', 'GOOGL', 'GOOG', 'AMZN', 'NVDA', 'TSLA', 'META', 'BRK-B', 'UNH', 
     'JNJ', 'XOM', 'JPM', 'V', 'LLY', 'PG', 'AVGO', 'HD', 'CVX', 'MA', 'MRK', 'ABBV', 
     'PEP', 'KO', 'COST', 'WMT', 'BAC', 'PFE', 'MCD', 'CSCO', 'TMO', 'ACN', 'CRM', 
@@ -18,100 +81,235 @@ SP500_TICKERS = [
     'SLB', 'MDLZ', 'CI', 'DUK', 'REGN', 'MMC', 'SO', 'PGR', 'MO', 'BDX', 'LMT', 'FISV', 'TGT',
     'NSC', 'SYK', 'EOG', 'ADP', 'AON', 'ITW', 'HCA', 'BSX', 'CMG', 'MU', 'CSX', 'CVS', 'CL',
     # This list can be expanded to the full 500. This is a representative sample.
-]
+)
+# Frozenset for O(1) membership checks (e.g. validating user-entered tickers).
+SP500_SET = frozenset(SP500_TICKERS)
 
 
 # --- API Communication & Caching ---
 # Caching is crucial for web apps to avoid re-fetching data on every interaction.
+# Fetchers return (data, error) tuples rather than calling st.error
+# themselves: Streamlit APIs are main-thread-only, so keeping UI calls out
+# of these functions lets the screeners run them from worker threads, and
+# keeps rendered errors out of the cached results.
+#
+# The cached inner functions raise on failure — st.cache_data does not
+# cache exceptions, so a transient outage is retried on the next run
+# instead of being served back for the full TTL. The thin public
+# wrappers translate exceptions into (None, message) for the UI.
+
+@st.cache_data(ttl=86400 * 7) # Cache for 7 days; the id/symbol catalog rarely changes
+def _fetch_coin_list():
+    url = "https://api.coingecko.com/api/v3/coins/list"
+    response = _session.get(url, timeout=10)
+    response.raise_for_status()
+    # Handle multiple coins with the same symbol.
+    # Structure: {'symbol': [('id1', 'name1'), ('id2', 'name2')]}
+    coin_map = defaultdict(list)
+    for coin in orjson.loads(response.content):
+        coin_map[coin['symbol'].lower()].append((coin['id'], coin['name']))
+    return dict(coin_map)
 
-@st.cache_data(ttl=3600) # Cache for 1 hour
 def get_coin_list():
     """Gets a list of all coins from CoinGecko and maps symbols to IDs."""
     try:
-        url = "https://api.coingecko.com/api/v3/coins/list"
-        response = requests.get(url)
-        response.raise_for_status()
-        # Handle multiple coins with the same symbol.
-        # Structure: {'symbol': [('id1', 'name1'), ('id2', 'name2')]}
-        coin_map = {}
-        for coin in response.json():
-            symbol = coin['symbol'].lower()
-            if symbol not in coin_map:
-                coin_map[symbol] = []
-            coin_map[symbol].append((coin['id'], coin['name']))
-        return coin_map
+        return _fetch_coin_list(), None
     except requests.exceptions.RequestException as e:
-        st.error(f"Error fetching coin list: {e}")
-        return None
+        return None, f"Error fetching coin list: {e}"
+
+@st.cache_data(ttl=86400) # Cache for 1 day; supply/community data moves slowly
+def _fetch_coin_static(coin_id):
+    # Construct the URL for the API endpoint
+    url = f"https://api.coingecko.com/api/v3/coins/{coin_id}?localization=false&tickers=false&market_data=true&community_data=true&developer_data=false&sparkline=false"
+    response = _session.get(url, timeout=10)
+    response.raise_for_status()  # Raise an exception for bad status codes
+    return orjson.loads(response.content)
+
+def get_coin_static(coin_id):
+    """Fetches the slow-moving profile data for a coin (supply, community)."""
+    try:
+        return _fetch_coin_static(coin_id), None
+    except requests.exceptions.RequestException as e:
+        return None, f"Error fetching coin data for '{coin_id}': {e}"
 
-@st.cache_data(ttl=3600) # Cache for 1 hour
-def get_coin_data(coin_id):
-    """Fetches detailed market data for a specific coin from CoinGecko."""
+@st.cache_data(ttl=60) # Cache for 1 minute; prices go stale fast
+def _fetch_coin_price(coin_id):
+    url = f"https://api.coingecko.com/api/v3/simple/price?ids={coin_id}&vs_currencies=usd&include_market_cap=true"
+    response = _session.get(url, timeout=10)
+    response.raise_for_status()
+    return orjson.loads(response.content).get(coin_id)
+
+def get_coin_price(coin_id):
+    """Fetches the current price and market cap for a coin."""
     try:
-        # Construct the URL for the API endpoint
-        url = f"https://api.coingecko.com/api/v3/coins/{coin_id}?localization=false&tickers=false&market_data=true&community_data=true&developer_data=false&sparkline=false"
-        response = requests.get(url)
-        response.raise_for_status()  # Raise an exception for bad status codes
-        return response.json()
+        return _fetch_coin_price(coin_id), None
     except requests.exceptions.RequestException as e:
-        st.error(f"Error fetching coin data for '{coin_id}': {e}")
-        return None
+        return None, f"Error fetching price for '{coin_id}': {e}"
+
+def get_coin_data(coin_id):
+    """Fetches detailed market data for a specific coin from CoinGecko.
+
+    Merges the long-lived profile payload with a fresh price quote, so a
+    re-analysis reuses the heavy request while price and market cap stay
+    current.
+    """
+    data, err = get_coin_static(coin_id)
+    if err or not data:
+        return None, err or f"Could not retrieve data for '{coin_id}'."
+    # A failed price refresh is non-fatal: the profile payload already
+    # carries a (possibly slightly stale) price.
+    price, _ = get_coin_price(coin_id)
+    if price:
+        market_data = data.setdefault('market_data', {})
+        if price.get('usd') is not None:
+            market_data.setdefault('current_price', {})['usd'] = price['usd']
+        if price.get('usd_market_cap'):
+            market_data.setdefault('market_cap', {})['usd'] = price['usd_market_cap']
+    return data, None
+
+@st.cache_data(ttl=86400) # Cache for 1 day; daily bars only change once a day
+def _fetch_coin_history(coin_id, days):
+    key = ('coin', coin_id, days, _utc_date())
+    cached = _disk_cache.get(key)
+    if cached is not None:
+        return cached
+    url = f"https://api.coingecko.com/api/v3/coins/{coin_id}/market_chart?vs_currency=usd&days={days}&interval=daily"
+    response = _session.get(url, timeout=10)
+    response.raise_for_status()
+    # We only need the market caps for our calculation. Return them as
+    # a float64 array of [timestamp, value] rows so consumers get the
+    # vectorized path without converting on every call.
+    caps = np.asarray(orjson.loads(response.content)['market_caps'], dtype=np.float64)
+    _disk_cache.set(key, caps, expire=86400)
+    return caps
 
 def get_historical_data(coin_id, days=180):
     """Fetches historical market cap data for the past X days."""
     try:
-        url = f"https://api.coingecko.com/api/v3/coins/{coin_id}/market_chart?vs_currency=usd&days={days}&interval=daily"
-        response = requests.get(url)
-        response.raise_for_status()
-        # We only need the market caps for our calculation
-        return response.json()['market_caps']
+        return _fetch_coin_history(coin_id, days), None
     except requests.exceptions.RequestException as e:
-        st.error(f"Error fetching historical data: {e}")
-        return None
+        return None, f"Error fetching historical data: {e}"
 
 # --- Stock Market API Communication ---
 
+@st.cache_data(ttl=600) # Cache for 10 minutes for screener
+def _fetch_bulk_prices(tickers):
+    data = yf.download(list(tickers), period="2d", group_by='ticker', threads=True, progress=False)
+    prices = {}
+    for ticker in tickers:
+        try:
+            closes = data[ticker]['Close'].dropna()
+        except KeyError:
+            continue
+        if not closes.empty:
+            prices[ticker] = float(closes.iloc[-1])
+    return prices
+
+def get_bulk_stock_prices(tickers):
+    """Fetches the latest closing price for many tickers in one batched call.
+
+    Returns {ticker: last_close}. Much cheaper than hitting .info per
+    ticker when all we need is a price to filter on.
+    """
+    try:
+        return _fetch_bulk_prices(tickers), None
+    except Exception as e:
+        return {}, f"Error fetching bulk stock prices: {e}"
+
+def _fetch_stock_info(ticker_symbol):
+    """Fetches raw market data for a stock ticker. Raises on failure.
+
+    Contains no Streamlit calls, so it is safe to run from worker threads
+    (Streamlit APIs are only usable from the main script thread).
+    """
+    ticker = yf.Ticker(ticker_symbol)
+    # .info is a property that can re-hit the network on every access, so
+    # grab it exactly once and work off the local snapshot.
+    info_snapshot = getattr(ticker, 'info', {}) or {}
+    if 'currentPrice' not in info_snapshot:
+        # Fallback for basic data if .info fails
+        hist = ticker.history(period="5d")
+        if hist.empty:
+            return None
+
+        # Create a minimal info dict
+        info = {
+            'shortName': ticker_symbol.upper(),
+            'symbol': ticker_symbol.upper(),
+            'currentPrice': float(hist['Close'].iloc[-1]),
+            'marketCap': info_snapshot.get('marketCap'), # Might be None
+            'trailingPE': info_snapshot.get('trailingPE'), # Might be None
+        }
+        return info
+
+    return info_snapshot
+
 def get_stock_data(ticker_symbol):
     """Fetches market data for a stock ticker from Yahoo Finance."""
     try:
-        ticker = yf.Ticker(ticker_symbol)
-        # .info can be slow and sometimes fails, so we have a check
-        if not ticker.info or 'currentPrice' not in ticker.info:
-            # Fallback for basic data if .info fails
-            hist = ticker.history(period="5d")
-            if hist.empty:
-                return None
-            
-            # Create a minimal info dict
-            info = {
-                'shortName': ticker_symbol.upper(),
-                'symbol': ticker_symbol.upper(),
-                'currentPrice': hist['Close'][-1],
-                'marketCap': ticker.info.get('marketCap'), # Might be None
-                'trailingPE': ticker.info.get('trailingPE'), # Might be None
-            }
-            return info
-
-        return ticker.info
+        return _fetch_stock_info(ticker_symbol), None
     except Exception as e:
-        st.error(f"Error fetching stock data for '{ticker_symbol}': {e}")
+        return None, f"Error fetching stock data for '{ticker_symbol}': {e}"
+
+@st.cache_data(ttl=1800, show_spinner=False) # Cache for 30 minutes; the last bar moves intraday
+def _fetch_stock_history(ticker_symbol, days):
+    # Bucket disk entries by 30-minute window to match the in-memory TTL:
+    # unlike CoinGecko's daily series, yfinance's latest bar moves
+    # intraday, so a day-keyed disk entry would serve stale momentum.
+    key = ('stock', ticker_symbol, days, int(time.time() // 1800))
+    cached = _disk_cache.get(key)
+    if cached is not None:
+        return cached
+    ticker = yf.Ticker(ticker_symbol)
+    hist = ticker.history(period=f"{days}d", interval="1d")
+    if hist.empty:
         return None
+    # Return the closing prices as a float64 array
+    closes = hist['Close'].to_numpy(dtype=np.float64)
+    _disk_cache.set(key, closes, expire=1800)
+    return closes
 
 def get_stock_historical_data(ticker_symbol, days=180):
     """Fetches historical price data for a stock."""
     try:
-        ticker = yf.Ticker(ticker_symbol)
-        hist = ticker.history(period=f"{days}d", interval="1d")
-        if hist.empty:
-            return None
-        # Return a list of closing prices
-        return hist['Close'].tolist()
+        return _fetch_stock_history(ticker_symbol, days), None
     except Exception as e:
-        st.error(f"Error fetching stock historical data: {e}")
-        return None
+        return None, f"Error fetching stock historical data: {e}"
 
 # --- Analysis & Calculation Engine ---
 
+def _avg_daily_growth(values):
+    """Average day-over-day growth rate of a value series, or None.
+
+    The arithmetic runs in a compiled numba kernel; this wrapper just
+    casts to a contiguous float64 array and maps NaN back to None.
+    """
+    if values is None:
+        return None
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    if values.size < 2:
+        return None
+    avg = _kernels.avg_growth(values)
+    if math.isnan(avg):
+        return None
+    return float(avg)
+
+@st.cache_data(ttl=600, show_spinner=False)
+def compute_growth_stats(values):
+    """Cached average daily growth for a value series.
+
+    Splitting growth computation from the O(1) days-to-target formula
+    means sweeping many target prices over the same series only pays for
+    the growth pass once.
+    """
+    return _avg_daily_growth(values)
+
+def _cap_values(historical_caps):
+    """Extracts the value column from [timestamp, value] market cap rows."""
+    if historical_caps is None or len(historical_caps) == 0:
+        return None
+    return np.asarray(historical_caps, dtype=np.float64)[:, 1]
+
 def calculate_scarcity_score(market_data):
     """Calculates a scarcity score based on supply metrics."""
     max_supply = market_data.get('max_supply')
@@ -128,29 +326,23 @@ def calculate_scarcity_score(market_data):
 
     return score, f"{percentage_circulated:.2f}% of max supply is in circulation."
 
-def predict_time_to_target(historical_caps, current_market_cap, target_market_cap):
+def predict_time_to_target(historical_caps, current_market_cap, target_market_cap, avg_daily_growth=None):
     """
     Predicts the time to reach a target market cap based on historical growth.
     Returns a string with the prediction.
+
+    Callers that already computed the average daily growth for the same
+    series can pass it in to skip recomputing it.
     """
     if target_market_cap <= current_market_cap:
         return "Target price is at or below the current price."
 
-    # Calculate daily growth rates from historical data
-    daily_growth_rates = []
-    # We look at pairs of days to find the growth rate between them
-    for i in range(1, len(historical_caps)):
-        # historical_caps[i] is a [timestamp, value] pair
-        prev_cap = historical_caps[i-1][1]
-        current_cap = historical_caps[i][1]
-        if prev_cap > 0:
-            daily_growth = (current_cap - prev_cap) / prev_cap
-            daily_growth_rates.append(daily_growth)
-
-    if not daily_growth_rates:
-        return "Not enough historical data to calculate growth rate."
+    # Calculate the average daily growth rate from historical data
+    if avg_daily_growth is None:
+        avg_daily_growth = _avg_daily_growth(_cap_values(historical_caps))
 
-    avg_daily_growth = sum(daily_growth_rates) / len(daily_growth_rates)
+    if avg_daily_growth is None:
+        return "Not enough historical data to calculate growth rate."
 
     if avg_daily_growth <= 0:
         return "Historical growth rate is zero or negative. Target may not be reached on this trajectory."
@@ -158,7 +350,7 @@ def predict_time_to_target(historical_caps, current_market_cap, target_market_ca
     # Formula: target = current * (1 + growth)^t
     # Solving for t: t = log(target / current) / log(1 + growth)
     try:
-        days_to_target = math.log(target_market_cap / current_market_cap) / math.log(1 + avg_daily_growth)
+        days_to_target = _kernels.days_to_target(current_market_cap, target_market_cap, avg_daily_growth)
     except ValueError:
         return "Could not compute a time estimate due to a mathematical error (e.g., log of negative number)."
 
@@ -172,13 +364,39 @@ def predict_time_to_target(historical_caps, current_market_cap, target_market_ca
     else:
         return f"Approx. {days_to_target:.1f} days"
 
-def generate_final_analysis(symbol, market_data, historical_caps):
-    """Generates a final score and summary based on all collected data."""
+def generate_final_analysis(symbol, market_data, historical_caps, avg_daily_growth=None):
+    """Generates a final score and summary based on all collected data.
+
+    Accepts a precomputed average daily growth so callers that also run
+    predict_time_to_target on the same series only pay for it once.
+    """
+    if avg_daily_growth is None:
+        avg_daily_growth = _avg_daily_growth(_cap_values(historical_caps))
+    # Reduce the inputs to scalars so the scoring core can be memoized
+    # with a small, hashable cache key.
+    return _score_crypto(
+        symbol,
+        market_data.get('max_supply'),
+        market_data.get('circulating_supply'),
+        market_data.get('market_cap', {}).get('usd', 0),
+        avg_daily_growth,
+        historical_caps is not None and len(historical_caps) > 0,
+    )
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _score_crypto(symbol, max_supply, circulating_supply, current_market_cap, avg_daily_growth, has_history):
+    """Scoring core behind generate_final_analysis.
+
+    Takes only scalars so Streamlit reruns (which re-execute the whole
+    script on every widget interaction) resolve repeat scores with a
+    cache lookup instead of recomputing.
+    """
     score = 0
     reasons = []
 
     # 1. Scarcity Analysis (Max 40 points)
-    scarcity_score, _ = calculate_scarcity_score(market_data)
+    scarcity_score, _ = calculate_scarcity_score(
+        {'max_supply': max_supply, 'circulating_supply': circulating_supply})
     score += scarcity_score * 4  # Scale 1-10 to 0-40
     if scarcity_score >= 8:
         reasons.append("[+] Strong Scarcity: Asset has a fixed supply, similar to Bitcoin.")
@@ -188,16 +406,8 @@ def generate_final_analysis(symbol, market_data, historical_caps):
         reasons.append("[-] Weak Scarcity: Asset is inflationary or has no defined max supply.")
 
     # 2. Network Growth Analysis (Max 40 points)
-    current_market_cap = market_data.get('market_cap', {}).get('usd', 0)
-    if historical_caps and current_market_cap > 0:
-        daily_growth_rates = []
-        for i in range(1, len(historical_caps)):
-            prev_cap, current_cap = historical_caps[i-1][1], historical_caps[i][1]
-            if prev_cap > 0:
-                daily_growth_rates.append((current_cap - prev_cap) / prev_cap)
-        
-        if daily_growth_rates:
-            avg_daily_growth = sum(daily_growth_rates) / len(daily_growth_rates)
+    if has_history and current_market_cap > 0:
+        if avg_daily_growth is not None:
             if avg_daily_growth > 0.005: # >0.5% daily growth
                 score += 40
                 reasons.append("[+] High Growth: Network value has shown strong positive momentum.")
@@ -277,24 +487,18 @@ def analyze_stock_growth_and_time(historical_prices, current_price, target_price
     if target_price <= current_price:
         return "Target is at or below current price.", "N/A"
 
-    daily_growth_rates = []
-    for i in range(1, len(historical_prices)):
-        prev_price, current_p = historical_prices[i-1], historical_prices[i]
-        if prev_price > 0:
-            daily_growth_rates.append((current_p - prev_price) / prev_price)
+    avg_daily_growth = compute_growth_stats(historical_prices)
 
-    if not daily_growth_rates:
+    if avg_daily_growth is None:
         return "Not enough data for prediction.", "N/A"
 
-    avg_daily_growth = sum(daily_growth_rates) / len(daily_growth_rates)
-
     if avg_daily_growth <= 0:
         return "Negative historical growth.", "N/A"
     
     required_growth = (target_price / current_price)
-    
+
     try:
-        days_to_target = math.log(required_growth) / math.log(1 + avg_daily_growth)
+        days_to_target = _kernels.days_to_target(current_price, target_price, avg_daily_growth)
     except ValueError:
         return "Could not compute time estimate.", "N/A"
 
@@ -308,19 +512,27 @@ def analyze_stock_growth_and_time(historical_prices, current_price, target_price
 
 def generate_stock_final_analysis(info, historical_prices):
     """Generates a final score and summary for a stock."""
+    # Reduce the inputs to scalars so the scoring core can be memoized
+    # with a small, hashable cache key.
+    return _score_stock(
+        info.get('trailingPE'),
+        compute_growth_stats(historical_prices),
+        historical_prices is not None and len(historical_prices) > 0,
+    )
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _score_stock(pe_ratio, avg_daily_growth, has_history):
+    """Scoring core behind generate_stock_final_analysis.
+
+    Takes only scalars so Streamlit reruns resolve repeat scores with a
+    cache lookup instead of recomputing.
+    """
     score = 0
     reasons = []
 
     # 1. Business Growth Analysis (Max 60 points)
-    if historical_prices:
-        daily_growth_rates = []
-        for i in range(1, len(historical_prices)):
-            prev_price, current_p = historical_prices[i-1], historical_prices[i]
-            if prev_price > 0:
-                daily_growth_rates.append((current_p - prev_price) / prev_price)
-        
-        if daily_growth_rates:
-            avg_daily_growth = sum(daily_growth_rates) / len(daily_growth_rates)
+    if has_history:
+        if avg_daily_growth is not None:
             if avg_daily_growth > 0.003: # >0.3% daily growth
                 score += 60
                 reasons.append("[+] Strong Growth: Stock has shown strong positive momentum.")
@@ -334,7 +546,6 @@ def generate_stock_final_analysis(info, historical_prices):
         reasons.append("[-] Could not determine growth.")
 
     # 2. Valuation Analysis (Max 40 points)
-    pe_ratio = info.get('trailingPE')
     if pe_ratio:
         if 0 < pe_ratio < 15:
             score += 40
@@ -376,9 +587,9 @@ def display_crypto_analysis(coin_id, symbol):
 
     if st.button("Analyze 📈", key=f"analyze_{coin_id}"):
         with st.spinner(f"Fetching data and running analysis for {symbol.upper()}..."):
-            data = get_coin_data(coin_id)
-            if not data:
-                st.error(f"Could not retrieve data for {coin_id}.")
+            data, err = get_coin_data(coin_id)
+            if err or not data:
+                st.error(err or f"Could not retrieve data for {coin_id}.")
                 return
 
             market_data = data.get('market_data', {})
@@ -388,7 +599,12 @@ def display_crypto_analysis(coin_id, symbol):
             
             scarcity_score, scarcity_desc = calculate_scarcity_score(market_data)
             target_mcap, req_growth, req_user_growth = analyze_network_growth(market_data, target_price)
-            historical_data = get_historical_data(coin_id)
+            historical_data, hist_err = get_historical_data(coin_id)
+            if hist_err:
+                st.error(hist_err)
+            # Both the time prediction and the final score need the same
+            # growth average, so compute it once here and pass it through.
+            avg_growth = compute_growth_stats(_cap_values(historical_data))
             
             # Display Metrics
             col1, col2 = st.columns(2)
@@ -407,15 +623,15 @@ def display_crypto_analysis(coin_id, symbol):
                 st.metric("Required Market Cap", target_mcap)
                 st.text(f"Required Value Growth: {req_growth}")
                 time_prediction = "N/A"
-                if historical_data and market_cap > 0 and target_mcap.startswith('$'):
+                if historical_data is not None and len(historical_data) > 0 and market_cap > 0 and target_mcap.startswith('$'):
                     target_mcap_float = float(target_mcap.replace('$', '').replace(',', ''))
-                    time_prediction = predict_time_to_target(historical_data, market_cap, target_mcap_float)
+                    time_prediction = predict_time_to_target(historical_data, market_cap, target_mcap_float, avg_daily_growth=avg_growth)
                 st.metric("Est. Time to Target", time_prediction)
 
             # Final Analysis
             with st.container(border=True):
                 st.subheader("Final Analysis (Not Financial Advice)")
-                score, grade, summary, reasons = generate_final_analysis(symbol, market_data, historical_data)
+                score, grade, summary, reasons = generate_final_analysis(symbol, market_data, historical_data, avg_daily_growth=avg_growth)
                 st.metric("Potential Score", f"{score}", help="Score out of 100 based on scarcity, growth, and catalysts.")
                 st.metric("Grade", grade, help=summary)
                 for reason in reasons:
@@ -429,16 +645,18 @@ def display_stock_analysis(ticker):
 
     if st.button("Analyze 📈", key=f"analyze_{ticker}"):
         with st.spinner(f"Fetching data for {ticker}..."):
-            info = get_stock_data(ticker)
-            if not info:
-                st.error(f"Could not retrieve data for {ticker}.")
+            info, err = get_stock_data(ticker)
+            if err or not info:
+                st.error(err or f"Could not retrieve data for {ticker}.")
                 return
             
             current_price = info.get('currentPrice', 0)
             market_cap = info.get('marketCap')
             pe_ratio = info.get('trailingPE')
             name = info.get('shortName', ticker)
-            historical_prices = get_stock_historical_data(ticker)
+            historical_prices, hist_err = get_stock_historical_data(ticker)
+            if hist_err:
+                st.error(hist_err)
             time_pred, growth_req = analyze_stock_growth_and_time(historical_prices, current_price, target_price)
             score, grade, summary, reasons = generate_stock_final_analysis(info, historical_prices)
 
@@ -465,9 +683,9 @@ def display_stock_analysis(ticker):
 def run_crypto_analysis():
     """Handles the UI for analyzing a single crypto by name."""
     st.subheader("Analyze a Specific Cryptocurrency")
-    coin_list = get_coin_list()
-    if not coin_list:
-        st.error("Could not load coin list. Please try again later.")
+    coin_list, err = get_coin_list()
+    if err or not coin_list:
+        st.error(err or "Could not load coin list. Please try again later.")
         return
 
     symbol = st.text_input("Enter a cryptocurrency symbol (e.g., btc, eth, kas)", "").lower().strip()
@@ -503,12 +721,10 @@ def run_crypto_screener():
     
     if st.button("Scan for Cryptos 🔎"):
         with st.spinner(f"Scanning the top {scan_limit} coins..."):
-            top_coins = get_top_coins(scan_limit)
-            if not top_coins:
-                st.error("Could not fetch coin data.")
+            found_coins, err = screen_coins_by_price(scan_limit, max_price)
+            if err:
+                st.error(err)
                 return
-            
-            found_coins = [c for c in top_coins if c.get('current_price') is not None and c['current_price'] <= max_price]
             st.session_state.found_coins = found_coins
 
     if 'found_coins' in st.session_state:
@@ -535,13 +751,35 @@ def run_stock_screener():
 
     if st.button("Scan S&P 500 Stocks 🔎"):
         found_stocks = []
+        failed_tickers = []
         progress_bar = st.progress(0, text="Starting S&P 500 Scan...")
         with st.spinner("Scanning S&P 500..."):
-            for i, ticker in enumerate(SP500_TICKERS):
-                progress_bar.progress((i+1)/len(SP500_TICKERS), text=f"Scanning {ticker}...")
-                stock_data = get_stock_data(ticker)
-                if stock_data and stock_data.get('currentPrice') and stock_data['currentPrice'] <= max_price:
-                    found_stocks.append(stock_data)
+            # First narrow the field with one batched price download, so the
+            # expensive per-ticker .info fetch only runs on tickers that can
+            # actually pass the price filter.
+            progress_bar.progress(0, text="Fetching prices for all tickers...")
+            bulk_prices, bulk_err = get_bulk_stock_prices(SP500_TICKERS)
+            if bulk_err:
+                st.warning(bulk_err)
+            candidates = [t for t in SP500_TICKERS
+                          if t not in bulk_prices or bulk_prices[t] <= max_price]
+            # The scan is network-bound, so fan the requests out over a thread
+            # pool and collect results as they complete. Workers only fetch;
+            # all Streamlit calls stay on the main thread.
+            with concurrent.futures.ThreadPoolExecutor(max_workers=32) as executor:
+                futures = {executor.submit(_fetch_stock_info, t): t for t in candidates}
+                for i, future in enumerate(concurrent.futures.as_completed(futures)):
+                    ticker = futures[future]
+                    progress_bar.progress((i+1)/len(candidates), text=f"Scanning {ticker}...")
+                    try:
+                        stock_data = future.result()
+                    except Exception:
+                        failed_tickers.append(ticker)
+                        continue
+                    if stock_data and stock_data.get('currentPrice') and stock_data['currentPrice'] <= max_price:
+                        found_stocks.append(stock_data)
+        if failed_tickers:
+            st.warning(f"Could not fetch data for: {', '.join(sorted(failed_tickers))}")
         st.session_state.found_stocks = found_stocks
     
     if 'found_stocks' in st.session_state:
@@ -559,17 +797,77 @@ def run_stock_screener():
             selected_stock = stock_options[selected_stock_str]
             display_stock_analysis(selected_stock['symbol'])
 
+def _market_page_url(page, per_page=250):
+    """URL for one page of the CoinGecko markets listing."""
+    return f"https://api.coingecko.com/api/v3/coins/markets?vs_currency=usd&order=market_cap_desc&per_page={per_page}&page={page}&sparkline=false"
+
 @st.cache_data(ttl=600) # Cache for 10 minutes for screener
+def _fetch_top_coins(limit):
+    # CoinGecko caps per_page at 250, so larger scans need multiple
+    # pages. Fetch them concurrently and stitch the results together.
+    pages = math.ceil(limit / 250)
+    coins = []
+    for page_coins in fetch_all([_market_page_url(p) for p in range(1, pages + 1)]):
+        coins.extend(page_coins)
+    return coins[:limit]
+
 def get_top_coins(limit=250):
     """Gets market data for the top N coins by market cap."""
     try:
-        url = f"https://api.coingecko.com/api/v3/coins/markets?vs_currency=usd&order=market_cap_desc&per_page={limit}&page=1&sparkline=false"
-        response = requests.get(url)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        st.error(f"Error fetching top coins: {e}")
-        return None
+        return _fetch_top_coins(limit), None
+    except httpx.HTTPError as e:
+        return None, f"Error fetching top coins: {e}"
+
+@st.cache_data(ttl=600) # Cache for 10 minutes for screener
+def _scan_coins_by_price(limit, max_price):
+    pages = math.ceil(limit / 250)
+    matches = []
+    scanned = 0
+    for batch_start in range(1, pages + 1, 4):
+        batch_pages = range(batch_start, min(batch_start + 4, pages + 1))
+        batch_matches = []
+        for page_coins in fetch_all([_market_page_url(p) for p in batch_pages]):
+            # The final page can carry more coins than the remaining scan
+            # budget; trim it so only the top `limit` ranked coins are
+            # ever considered, as the UI promises.
+            page_coins = page_coins[:limit - scanned]
+            scanned += len(page_coins)
+            batch_matches.extend(
+                c for c in page_coins
+                if c.get('current_price') is not None and c['current_price'] <= max_price
+            )
+        matches.extend(batch_matches)
+        if not batch_matches:
+            break
+    return matches
+
+def screen_coins_by_price(limit, max_price):
+    """Scans up to `limit` top coins and keeps those priced at or under max_price.
+
+    Walks down the market-cap ranking in parallel batches of four pages
+    and stops as soon as a whole batch produces no matches, on the
+    assumption that a dry stretch of 1000 coins marks the end of useful
+    results. For typical low price caps this scans a fraction of the
+    requested range.
+    """
+    try:
+        return _scan_coins_by_price(limit, max_price), None
+    except httpx.HTTPError as e:
+        return None, f"Error scanning coins: {e}"
+
+def _warm_caches():
+    """Primes the hot caches so the first interaction hits memory.
+
+    Runs on a daemon thread at startup. st.cache_data writes are
+    thread-safe, and a network failure here is harmless because the
+    interactive path fetches on demand anyway.
+    """
+    try:
+        get_coin_list()
+        get_top_coins(250)
+        get_bulk_stock_prices(SP500_TICKERS[:20])
+    except Exception:
+        pass
 
 def main():
     """Main function to run the Streamlit app."""
@@ -581,6 +879,12 @@ def main():
     if 'page' not in st.session_state:
         st.session_state.page = 'Home'
 
+    # Prefetch popular data in the background so the first analysis or
+    # scan of the session starts from a warm cache.
+    if 'warmed' not in st.session_state:
+        threading.Thread(target=_warm_caches, daemon=True).start()
+        st.session_state.warmed = True
+
     # Sidebar for navigation
     with st.sidebar:
         st.header("Navigation")